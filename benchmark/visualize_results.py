@@ -10,66 +10,298 @@ This script generates separate, clearly labeled visualizations for each test typ
 """
 
 import pandas as pd
+import matplotlib
+matplotlib.use('Agg')  # Figures are only written to PNG; skip interactive backend setup
 import matplotlib.pyplot as plt
+from matplotlib.lines import Line2D
 import seaborn as sns
 import numpy as np
+import hashlib
+import json
 import os
+import re
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
+try:
+    import pyarrow as pa
+    import pyarrow.compute as pc
+    import pyarrow.csv as pa_csv
+    import pyarrow.dataset as ds
+    import pyarrow.parquet as pq
+except ImportError:
+    pa = None
+
+plt.style.use('seaborn-v0_8')
+sns.set_palette("husl")
+
+# Column types for the benchmark CSV output (see BenchmarkRunner::save_results_csv)
+RESULT_SCHEMA = {
+    'test_type': 'string',
+    'config': 'string',
+    'total_ops': 'int64',
+    'total_time_sec': 'float64',
+    'throughput_ops_per_sec': 'float64',
+    'mean_latency_ns': 'float64',
+    'p50_latency_ns': 'float64',
+    'p95_latency_ns': 'float64',
+    'p99_latency_ns': 'float64',
+    'p99_9_latency_ns': 'float64',
+    'peak_memory_kb': 'float64',
+    'cpu_cycles_per_op': 'float64',
+    'instructions_per_cycle': 'float64',
+    'l1_cache_miss_rate': 'float64',
+    'l2_cache_miss_rate': 'float64',
+    'l3_cache_miss_rate': 'float64',
+    'memory_bandwidth_gb_per_sec': 'float64',
+    'branch_misprediction_rate': 'float64',
+}
+
+# Invalid measurements (e.g. empty latency samples) are written as inf/nan (MSVC: -nan(ind))
+CSV_NULL_VALUES = ['', 'nan', 'NaN', '-nan', 'nan(ind)', '-nan(ind)', 'inf', '-inf']
+
+# Parsed results are cached next to the CSVs; bump the version when the cached layout changes
+CACHE_FILENAME = '_cache.parquet'
+CACHE_VERSION = '2'
+CACHE_VERSION_KEY = b'lob_results_cache_version'
+CACHE_FINGERPRINT_KEY = b'lob_results_cache_fingerprint'
+
+# Hardware counter columns, present when the benchmark ran with perf counters enabled
+HARDWARE_COLS = ['cpu_cycles_per_op', 'instructions_per_cycle', 'l1_cache_miss_rate',
+                 'l2_cache_miss_rate', 'l3_cache_miss_rate', 'memory_bandwidth_gb_per_sec',
+                 'branch_misprediction_rate']
+
+# Per-(config, test_type) means shared by every summary table and aggregated plot
+SUMMARY_COLS = ['total_ops', 'throughput_ops_per_sec', 'mean_latency_ns', 'p99_latency_ns'] + HARDWARE_COLS
+
+LATENCY_COLS = ['mean_latency_ns', 'p50_latency_ns', 'p95_latency_ns', 'p99_latency_ns', 'p99_9_latency_ns']
+
+# Only these result columns are decoded when reading CSVs or the cache
+NEEDED_COLS = {'config', 'test_type', 'total_ops', 'total_time_sec', 'throughput_ops_per_sec',
+               *LATENCY_COLS, 'peak_memory_kb', *HARDWARE_COLS}
+
+# Columns derived from result file names and directories
+METADATA_COLS = {'source_file', 'events_count', 'data_file', 'source_dir'}
+
+# New-format result file names: <config>_<events>_<datafile>.csv (datafile may contain underscores)
+RESULT_FILENAME_PATTERN = r'^(?P<config>[^_]+)_(?P<events_count>[^_]+)_(?P<data_file>.+)\.csv$'
+RESULT_FILENAME_RE = re.compile(RESULT_FILENAME_PATTERN)
+
+def results_convert_options(include_columns=None):
+    """PyArrow CSV conversion options enforcing RESULT_SCHEMA"""
+    return pa_csv.ConvertOptions(
+        column_types={col: pa.type_for_alias(t) for col, t in RESULT_SCHEMA.items()},
+        null_values=CSV_NULL_VALUES,
+        include_columns=include_columns
+    )
+
+def read_csv_header(csv_file):
+    """Return the column names from the first line of a CSV file"""
+    with open(csv_file) as f:
+        return f.readline().rstrip('\r\n').split(',')
+
+def read_results_csv(csv_file):
+    """Read a single results CSV with typed columns, as a PyArrow Table when available, else a DataFrame"""
+    if pa is None:
+        df = pd.read_csv(csv_file, na_values=CSV_NULL_VALUES, usecols=lambda c: c in NEEDED_COLS)
+        # Without a typed parser, coerce any unparseable numeric token to NaN here
+        for col, t in RESULT_SCHEMA.items():
+            if t != 'string' and col in df.columns:
+                df[col] = pd.to_numeric(df[col], errors='coerce')
+        return df
+    
+    # PyArrow needs explicit names to project, so take the ones present in the header
+    include_columns = [col for col in read_csv_header(csv_file) if col in NEEDED_COLS]
+    return pa_csv.read_csv(csv_file, convert_options=results_convert_options(include_columns))
+
+def with_label_column(frame, name, value):
+    """Add a constant string column to a Table or DataFrame returned by read_results_csv"""
+    if pa is None:
+        frame[name] = value
+        return frame
+    return frame.append_column(name, pa.array([value] * frame.num_rows, type=pa.string()))
+
+def read_named_results_csv(csv_file):
+    """Read a new-format results file, labelling rows with the metadata in its name"""
+    frame = read_results_csv(csv_file)
+    # Extract metadata from filename
+    match = RESULT_FILENAME_RE.match(csv_file.name)
+    if match:
+        frame = with_label_column(frame, 'source_file', csv_file.name)
+        frame = with_label_column(frame, 'events_count', match['events_count'])
+        frame = with_label_column(frame, 'data_file', match['data_file'])
+    return frame
+
+def read_summary_csv(csv_file):
+    """Read an old-format summary file, labelling rows with its run directory"""
+    return with_label_column(read_results_csv(csv_file), 'source_dir', csv_file.parent.name)
+
+def read_result_files(csv_files, read_file, indent):
+    """Read result files on a thread pool (the CSV parsers release the GIL), keeping input order
+
+    Returns the frames that loaded and the files that failed to load.
+    """
+    frames, failed_files = [], []
+    with ThreadPoolExecutor(max_workers=os.cpu_count()) as executor:
+        futures = [executor.submit(read_file, csv_file) for csv_file in csv_files]
+        for csv_file, future in zip(csv_files, futures):
+            print(f"{indent}Loading {csv_file.name}")
+            try:
+                frames.append(future.result())
+            except Exception as e:
+                print(f"    Error loading {csv_file}: {e}")
+                failed_files.append(csv_file)
+    return frames, failed_files
+
+def combine_results(frames):
+    """Combine per-file results into one DataFrame, concatenating in Arrow when available"""
+    if pa is None:
+        return pd.concat(frames, ignore_index=True)
+    
+    # Zero-copy chunk concatenation, then a single conversion that frees Arrow buffers as it goes
+    table = pa.concat_tables(frames, promote_options='default')
+    return table.to_pandas(split_blocks=True, self_destruct=True)
+
+def scan_results_dataset(csv_files):
+    """Read all new-format result files in one multithreaded Arrow dataset scan"""
+    # The dataset would otherwise take its schema from the first file only and drop columns
+    # missing there; use the union of all headers so files lacking a column read it as null
+    header_cols = set()
+    for csv_file in csv_files:
+        header_cols.update(read_csv_header(csv_file))
+    schema = pa.schema([(col, pa.type_for_alias(t)) for col, t in RESULT_SCHEMA.items()
+                        if col in header_cols and col in NEEDED_COLS])
+    
+    dataset = ds.dataset([str(f) for f in csv_files], schema=schema,
+                         format=ds.CsvFileFormat(convert_options=results_convert_options()))
+    scanner = dataset.scanner(use_threads=True)
+    
+    # Each scanned batch is tagged with the file it came from
+    batches, batch_files = [], []
+    for tagged in scanner.scan_batches():
+        batches.append(tagged.record_batch)
+        batch_files.append(tagged.fragment.path)
+    table = pa.Table.from_batches(batches, schema=scanner.projected_schema)
+    
+    row_files = np.repeat(np.array(batch_files, dtype=object), [b.num_rows for b in batches])
+    source_file = pc.replace_substring_regex(pa.array(row_files, type=pa.string()), r'^.*[/\\]', '')
+    
+    # Extract metadata from filename in one regex pass over the column
+    filename_parts = pc.extract_regex(source_file, RESULT_FILENAME_PATTERN)
+    table = table.append_column('source_file', source_file)
+    table = table.append_column('events_count', pc.struct_field(filename_parts, 'events_count'))
+    table = table.append_column('data_file', pc.struct_field(filename_parts, 'data_file'))
+    return table.to_pandas()
+
+def results_fingerprint(file_stats):
+    """Digest of the (name, size, mtime_ns) of every result file, identifying the cached input set"""
+    return hashlib.sha256(json.dumps(sorted(file_stats)).encode()).hexdigest().encode()
+
+def load_cached_results(cache_file, fingerprint):
+    """Return the cached results if they were built from exactly the current set of result files"""
+    if pa is None:
+        return None
+    
+    try:
+        schema = pq.read_schema(cache_file)
+        metadata = schema.metadata or {}
+        if metadata.get(CACHE_VERSION_KEY) != CACHE_VERSION.encode():
+            print("  Ignoring results cache written by a different version")
+            return None
+        if metadata.get(CACHE_FINGERPRINT_KEY) != fingerprint:
+            return None
+        columns = [col for col in schema.names if col in NEEDED_COLS or col in METADATA_COLS]
+        return pd.read_parquet(cache_file, columns=columns, engine='pyarrow')
+    except Exception as e:
+        print(f"  Error reading results cache {cache_file}: {e}")
+        return None
+
+def save_cached_results(df, cache_file, fingerprint):
+    """Write the combined results to the Parquet cache, tagged with the cache version and input fingerprint"""
+    if pa is None:
+        return
+    
+    try:
+        table = pa.Table.from_pandas(df, preserve_index=False)
+        metadata = dict(table.schema.metadata or {})
+        metadata[CACHE_VERSION_KEY] = CACHE_VERSION.encode()
+        metadata[CACHE_FINGERPRINT_KEY] = fingerprint
+        pq.write_table(table.replace_schema_metadata(metadata), cache_file, compression='zstd')
+    except Exception as e:
+        print(f"  Error writing results cache {cache_file}: {e}")
+
 def load_benchmark_results(results_dir):
     """Load all benchmark results from the results directory"""
     results_path = Path(results_dir)
+    cache_file = results_path / CACHE_FILENAME
     all_data = []
     
     print(f"Scanning results directory: {results_path}")
     
-    # New format: Look for CSV files with pattern <config>_<events>_<datafile>.csv directly in results directory
-    csv_files = list(results_path.glob("*_*_*.csv"))
+    # One directory pass finds the new-format result files (<config>_<events>_<datafile>.csv)
+    # and records the stats needed to validate the cache
+    csv_files, file_stats, has_cache = [], [], False
+    with os.scandir(results_path) as entries:
+        for entry in entries:
+            if not entry.is_file():
+                continue
+            if entry.name == CACHE_FILENAME:
+                has_cache = True
+            elif entry.name.endswith('.csv') and entry.name.count('_') >= 2:
+                csv_files.append(Path(entry.path))
+                stat = entry.stat()
+                file_stats.append((entry.name, stat.st_size, stat.st_mtime_ns))
+    fingerprint = results_fingerprint(file_stats)
+    
+    # Reuse the parsed results if the result files are exactly those the cache was built from
+    if csv_files and has_cache:
+        cached_df = load_cached_results(cache_file, fingerprint)
+        if cached_df is not None:
+            print(f"Loaded {len(cached_df)} benchmark records from {cache_file.name}")
+            return cached_df
+    
+    # New format: CSV files directly in results directory
+    # Only a complete load of the new-format files matches their fingerprint and may be cached
+    combined_df = None
+    load_complete = False
     if csv_files:
         print(f"Found {len(csv_files)} result files in new format")
-        for csv_file in csv_files:
-            print(f"  Loading {csv_file.name}")
+        if pa is not None:
             try:
-                df = pd.read_csv(csv_file)
-                # Extract metadata from filename
-                filename_parts = csv_file.stem.split('_')
-                if len(filename_parts) >= 3:
-                    config_name = filename_parts[0]
-                    events = filename_parts[1]
-                    datafile = '_'.join(filename_parts[2:])  # In case datafile has underscores
-                    df['source_file'] = csv_file.name
-                    df['events_count'] = events
-                    df['data_file'] = datafile
-                all_data.append(df)
+                combined_df = scan_results_dataset(csv_files)
+                load_complete = True
             except Exception as e:
-                print(f"    Error loading {csv_file}: {e}")
+                print(f"  Error scanning result files, loading them individually: {e}")
+    
+    if csv_files and combined_df is None:
+        all_data, failed_files = read_result_files(csv_files, read_named_results_csv, "  ")
+        load_complete = not failed_files
     
     # Fallback: Old format - Look for summary files in subdirectories
-    if not all_data:
+    if combined_df is None and not all_data:
         print("No files in new format found, checking for old format...")
+        summary_files = []
         for subdir in results_path.iterdir():
             if subdir.is_dir():
                 print(f"  Checking {subdir.name}")
                 
                 # Look for summary files
-                for csv_file in subdir.glob("*_summary.csv"):
-                    print(f"    Loading {csv_file.name}")
-                    try:
-                        df = pd.read_csv(csv_file)
-                        df['source_dir'] = subdir.name
-                        all_data.append(df)
-                    except Exception as e:
-                        print(f"    Error loading {csv_file}: {e}")
-    
-    if not all_data:
-        print("No benchmark data found!")
-        return pd.DataFrame()
-    
-    # Combine all data
-    combined_df = pd.concat(all_data, ignore_index=True)
+                summary_files.extend(subdir.glob("*_summary.csv"))
+        all_data, _ = read_result_files(summary_files, read_summary_csv, "    ")
+    
+    if combined_df is None:
+        if not all_data:
+            print("No benchmark data found!")
+            return pd.DataFrame()
+        
+        # Combine all data
+        combined_df = combine_results(all_data)
     print(f"Loaded {len(combined_df)} benchmark records")
     
+    if load_complete:
+        save_cached_results(combined_df, cache_file, fingerprint)
+    
     return combined_df
 
 def clean_data(df):
@@ -85,31 +317,37 @@ def clean_data(df):
                    'l2_cache_miss_rate', 'l3_cache_miss_rate', 'memory_bandwidth_gb_per_sec',
                    'branch_misprediction_rate']
     
-    for col in numeric_cols:
-        if col in df.columns:
-            # Replace inf and very large values with NaN
-            df[col] = pd.to_numeric(df[col], errors='coerce')
-            df[col] = df[col].replace([np.inf, -np.inf], np.nan)
-            # Remove outliers (values > 1e10)
-            df.loc[df[col] > 1e10, col] = np.nan
+    existing_cols = [col for col in numeric_cols if col in df.columns]
+    
+    # Replace inf and outliers (values > 1e10) with NaN in one pass over the numeric block
+    # (types are enforced at parse time)
+    values = df[existing_cols].to_numpy(dtype=np.float64, copy=False)
+    values = np.where(np.isfinite(values) & (values <= 1e10), values, np.nan)
+    
+    # Convert cache miss rates and branch misprediction rates to percentages for better readability
+    rate_cols = ['l1_cache_miss_rate', 'l2_cache_miss_rate', 'l3_cache_miss_rate', 'branch_misprediction_rate']
+    rate_idx = [existing_cols.index(col) for col in rate_cols if col in existing_cols]
+    values[:, rate_idx] *= 100
+    
+    test_types = df['test_type'].to_numpy()
     
     # For throughput tests, latency values are intentionally 0 - mark as N/A for display
-    latency_cols = ['mean_latency_ns', 'p50_latency_ns', 'p95_latency_ns', 'p99_latency_ns', 'p99_9_latency_ns']
-    throughput_mask = df['test_type'] == 'throughput'
-    for col in latency_cols:
-        if col in df.columns:
-            df.loc[throughput_mask & (df[col] == 0), col] = np.nan
+    latency_idx = [existing_cols.index(col) for col in LATENCY_COLS if col in existing_cols]
+    latency_values = values[:, latency_idx]
+    latency_values[(test_types == 'throughput')[:, np.newaxis] & (latency_values == 0)] = np.nan
+    values[:, latency_idx] = latency_values
     
     # For latency tests, throughput values are intentionally 0 - mark as N/A for display
-    latency_mask = df['test_type'] == 'latency'
-    if 'throughput_ops_per_sec' in df.columns:
-        df.loc[latency_mask & (df['throughput_ops_per_sec'] == 0), 'throughput_ops_per_sec'] = np.nan
+    if 'throughput_ops_per_sec' in existing_cols:
+        throughput_values = values[:, existing_cols.index('throughput_ops_per_sec')]
+        throughput_values[(test_types == 'latency') & (throughput_values == 0)] = np.nan
     
-    # Convert cache miss rates and branch misprediction rates to percentages for better readability
-    rate_cols = ['l1_cache_miss_rate', 'l2_cache_miss_rate', 'l3_cache_miss_rate', 'branch_misprediction_rate']
-    for col in rate_cols:
+    df[existing_cols] = values
+    
+    # Low-cardinality labels become categoricals so groupby and masks compare integer codes
+    for col in ('config', 'test_type', 'data_file', 'events_count'):
         if col in df.columns:
-            df[col] = df[col] * 100
+            df[col] = df[col].astype('category')
     
     print(f"After cleaning: {len(df)} valid records")
     return df
@@ -122,41 +360,60 @@ def create_visualizations(df, output_dir="visualizations"):
     
     os.makedirs(output_dir, exist_ok=True)
     
-    plt.style.use('seaborn-v0_8')
-    sns.set_palette("husl")
+    # Group once by config and test_type; every aggregated table and plot slices this
+    agg_dict = {col: 'mean' for col in SUMMARY_COLS if col in df.columns}
+    summary = df.groupby(['config', 'test_type'], observed=True).agg(agg_dict)
+    test_types = set(summary.index.get_level_values('test_type'))
     
-    latency_data = df[df['test_type'] == 'latency'].copy()
-    throughput_data = df[df['test_type'] == 'throughput'].copy()
+    create_summary_table(summary, output_dir)
     
-    create_summary_table(df, output_dir)
+    # The single-panel plots share one figure, cleared between plots
+    fig, ax = plt.subplots(figsize=(12, 8))
     
-    if not latency_data.empty and not throughput_data.empty:
-        create_throughput_vs_latency(latency_data, throughput_data, output_dir)
+    if 'latency' in test_types and 'throughput' in test_types:
+        create_throughput_vs_latency(summary, ax, output_dir)
     
-    if not latency_data.empty:
-        create_latency_bar_plot(df, output_dir)
+    if 'latency' in test_types:
+        create_latency_bar_plot(summary, ax, output_dir)
     
-    if not throughput_data.empty:
-        create_throughput_bar_plot(df, output_dir)
+    if 'throughput' in test_types:
+        create_throughput_bar_plot(summary, ax, output_dir)
+    
+    plt.close(fig)
     
     create_hardware_metrics_charts(df, output_dir)
     
-    create_hardware_summary_table(df, output_dir)
+    create_hardware_summary_table(summary, output_dir)
+
+
+def with_observed_configs(data):
+    """Drop config categories with no rows left, so seaborn does not draw empty slots for them"""
+    if isinstance(data['config'].dtype, pd.CategoricalDtype):
+        data = data.assign(config=data['config'].cat.remove_unused_categories())
+    return data
+
+def has_variation(values):
+    """Whether values holds at least two distinct per-config values, i.e. a bar chart of it shows anything"""
+    return len(values) > 0 and values.nunique(dropna=True) >= 2
 
+def skip_plot(output_dir, filename):
+    """Report a plot skipped for lack of variation; an existing file of that name is left untouched"""
+    print(f"Skipping {filename}: insufficient variation (not regenerated; any {filename} "
+          f"already in {output_dir} is from an earlier run)")
 
-def create_throughput_vs_latency(latency_data, throughput_data, output_dir):
+def reset_axes(ax):
+    """Clear a reused axes, restoring the grid and tick settings that cla() keeps from the previous plot"""
+    ax.cla()
+    ax.grid(plt.rcParams['axes.grid'], alpha=plt.rcParams['grid.alpha'])
+    ax.tick_params(axis='x', rotation=0)
+
+def create_throughput_vs_latency(summary, ax, output_dir):
     """Create throughput vs latency scatter plot using sustained throughput from test 2 and latency from test 1"""
-    plt.figure(figsize=(12, 8))
-    
-    # Group latency data by config and take mean values
-    latency_agg = latency_data.groupby('config').agg({
-        'mean_latency_ns': 'mean'
-    }).reset_index()
+    reset_axes(ax)
     
-    # Group throughput data by config and take mean values  
-    throughput_agg = throughput_data.groupby('config').agg({
-        'throughput_ops_per_sec': 'mean'
-    }).reset_index()
+    # Mean latency per config from the latency test, mean throughput per config from the throughput test
+    latency_agg = summary.xs('latency', level='test_type')[['mean_latency_ns']].reset_index()
+    throughput_agg = summary.xs('throughput', level='test_type')[['throughput_ops_per_sec']].reset_index()
     
     # Merge the two datasets on config
     mixed_data = pd.merge(latency_agg, throughput_agg, on='config', how='inner')
@@ -164,87 +421,78 @@ def create_throughput_vs_latency(latency_data, throughput_data, output_dir):
     # Create a color palette for each configuration
     colors = sns.color_palette("husl", len(mixed_data))
     
-    # Scatter plot with different colors for each config
-    for i, (_, row) in enumerate(mixed_data.iterrows()):
-        plt.scatter(row['mean_latency_ns'], row['throughput_ops_per_sec'], 
-                   s=100, alpha=0.8, color=colors[i], label=row['config'])
-    
-    plt.xlabel('Mean Latency (ns) - from Latency Test')
-    plt.ylabel('Sustained Throughput (ops/sec) - from Throughput Test')
-    plt.title('Latency vs Throughput Trade-off')
-    plt.grid(True, alpha=0.3)
-    plt.legend(bbox_to_anchor=(1.05, 1), loc='upper left')
-    plt.tight_layout()
-    plt.savefig(f"{output_dir}/throughput_vs_latency.png", dpi=300, bbox_inches='tight')
-    plt.close()
+    # Single scatter call with one color per config; the legend is built from proxy artists
+    ax.scatter(mixed_data['mean_latency_ns'].to_numpy(), mixed_data['throughput_ops_per_sec'].to_numpy(),
+               s=100, alpha=0.8, c=colors)
+    legend_handles = [Line2D([], [], marker='o', linestyle='', markersize=10, alpha=0.8,
+                             color=colors[i], label=config)
+                      for i, config in enumerate(mixed_data['config'])]
+    
+    ax.set_xlabel('Mean Latency (ns) - from Latency Test')
+    ax.set_ylabel('Sustained Throughput (ops/sec) - from Throughput Test')
+    ax.set_title('Latency vs Throughput Trade-off')
+    ax.grid(True, alpha=0.3)
+    ax.legend(handles=legend_handles, bbox_to_anchor=(1.05, 1), loc='upper left')
+    ax.figure.tight_layout()
+    ax.figure.savefig(f"{output_dir}/throughput_vs_latency.png", dpi=150)
     print(f"Created throughput_vs_latency.png")
 
-def create_latency_bar_plot(df, output_dir):
+def create_latency_bar_plot(summary, ax, output_dir):
     """Create bar plot for latency using summary table data"""
-    plt.figure(figsize=(12, 8))
+    reset_axes(ax)
+    
+    latency_summary = summary.xs('latency', level='test_type')[['mean_latency_ns']].reset_index()
     
-    # Get latency data from summary table (same aggregation as summary_table function)
-    latency_summary = df[df['test_type'] == 'latency'].groupby('config').agg({
-        'mean_latency_ns': 'mean'
-    }).reset_index()
+    valid_data = with_observed_configs(latency_summary.dropna(subset=['mean_latency_ns']))
+    if not has_variation(valid_data['mean_latency_ns']):
+        skip_plot(output_dir, "latency_bar_plot.png")
+        return
     
-    valid_data = latency_summary.dropna(subset=['mean_latency_ns'])
-    if not valid_data.empty:
-        bars = sns.barplot(data=valid_data, x='config', y='mean_latency_ns')
-        plt.title('Mean Latency by Configuration')
-        plt.xlabel('Configuration')
-        plt.ylabel('Mean Latency (ns)')
-        plt.xticks(rotation=45)
+    sns.barplot(data=valid_data, x='config', y='mean_latency_ns', ax=ax)
+    ax.set_title('Mean Latency by Configuration')
+    ax.set_xlabel('Configuration')
+    ax.set_ylabel('Mean Latency (ns)')
+    ax.tick_params(axis='x', rotation=45)
     
-    plt.tight_layout()
-    plt.savefig(f"{output_dir}/latency_bar_plot.png", dpi=300, bbox_inches='tight')
-    plt.close()
+    ax.figure.tight_layout()
+    ax.figure.savefig(f"{output_dir}/latency_bar_plot.png", dpi=150)
     print(f"Created latency_bar_plot.png")
 
-def create_throughput_bar_plot(df, output_dir):
+def create_throughput_bar_plot(summary, ax, output_dir):
     """Create bar plot for throughput using summary table data"""
-    plt.figure(figsize=(12, 8))
+    reset_axes(ax)
     
-    # Get throughput data from summary table (same aggregation as summary_table function)
-    throughput_summary = df[df['test_type'] == 'throughput'].groupby('config').agg({
-        'throughput_ops_per_sec': 'mean'
-    }).reset_index()
+    throughput_summary = summary.xs('throughput', level='test_type')[['throughput_ops_per_sec']].reset_index()
     
-    valid_data = throughput_summary.dropna(subset=['throughput_ops_per_sec'])
-    if not valid_data.empty:
-        bars = sns.barplot(data=valid_data, x='config', y='throughput_ops_per_sec')
-        plt.title('Sustained Throughput by Configuration')
-        plt.xlabel('Configuration')
-        plt.ylabel('Throughput (ops/sec)')
-        plt.xticks(rotation=45)
+    valid_data = with_observed_configs(throughput_summary.dropna(subset=['throughput_ops_per_sec']))
+    if not has_variation(valid_data['throughput_ops_per_sec']):
+        skip_plot(output_dir, "throughput_bar_plot.png")
+        return
     
-    plt.tight_layout()
-    plt.savefig(f"{output_dir}/throughput_bar_plot.png", dpi=300, bbox_inches='tight')
-    plt.close()
+    sns.barplot(data=valid_data, x='config', y='throughput_ops_per_sec', ax=ax)
+    ax.set_title('Sustained Throughput by Configuration')
+    ax.set_xlabel('Configuration')
+    ax.set_ylabel('Throughput (ops/sec)')
+    ax.tick_params(axis='x', rotation=45)
+    
+    ax.figure.tight_layout()
+    ax.figure.savefig(f"{output_dir}/throughput_bar_plot.png", dpi=150)
     print(f"Created throughput_bar_plot.png")
 
-def create_summary_table(df, output_dir):
+def format_column(values, fmt, na_rep=None):
+    """Format a numeric column as strings in one NumPy pass, optionally replacing NaN with na_rep"""
+    values = values.to_numpy(dtype=np.float64)
+    formatted = np.char.mod(fmt, values)
+    if na_rep is not None:
+        formatted = np.where(np.isnan(values), na_rep, formatted)
+    return formatted
+
+def create_summary_table(summary, output_dir):
     """Create a summary table of all results"""
-    if df.empty:
+    if summary.empty:
         return
     
-    # Group by config and test_type, get mean values
-    agg_dict = {
-        'total_ops': 'mean',
-        'throughput_ops_per_sec': 'mean',
-        'mean_latency_ns': 'mean',
-        'p99_latency_ns': 'mean'
-    }
-    
-    # Add hardware metrics if available
-    hardware_cols = ['cpu_cycles_per_op', 'instructions_per_cycle', 'l1_cache_miss_rate', 
-                    'l2_cache_miss_rate', 'l3_cache_miss_rate', 'memory_bandwidth_gb_per_sec', 
-                    'branch_misprediction_rate']
-    for col in hardware_cols:
-        if col in df.columns:
-            agg_dict[col] = 'mean'
-    
-    summary = df.groupby(['config', 'test_type']).agg(agg_dict).round(2)
+    summary = summary.round(2)
     
     # Save as CSV
     summary.to_csv(f"{output_dir}/performance_summary.csv")
@@ -255,33 +503,25 @@ def create_summary_table(df, output_dir):
     ax.axis('tight')
     ax.axis('off')
     
-    # Create table data with N/A for missing latency data
-    table_data = []
-    for (config, test_type), row in summary.iterrows():
-        mean_lat = "N/A" if pd.isna(row['mean_latency_ns']) else f"{row['mean_latency_ns']:.0f}"
-        p99_lat = "N/A" if pd.isna(row['p99_latency_ns']) else f"{row['p99_latency_ns']:.0f}"
-        
-        table_row = [
-            config,
-            test_type,
-            f"{row['total_ops']:.0f}",
-            f"{row['throughput_ops_per_sec']:.0f}",
-            mean_lat,
-            p99_lat
-        ]
-        
-        # Add hardware metrics if available
-        if 'cpu_cycles_per_op' in row:
-            table_row.append(f"{row['cpu_cycles_per_op']:.1f}")
-        
-        table_data.append(table_row)
+    # Create table data with N/A for missing latency data, formatted a column at a time
+    table_columns = [
+        summary.index.get_level_values('config').to_numpy(),
+        summary.index.get_level_values('test_type').to_numpy(),
+        format_column(summary['total_ops'], '%.0f'),
+        format_column(summary['throughput_ops_per_sec'], '%.0f'),
+        format_column(summary['mean_latency_ns'], '%.0f', na_rep='N/A'),
+        format_column(summary['p99_latency_ns'], '%.0f', na_rep='N/A')
+    ]
     
     headers = ['Config', 'Test Type', 'Total Ops', 'Throughput (ops/s)', 'Mean Latency (ns)', 'P99 Latency (ns)']
     
-    # Add hardware metric headers if available
+    # Add hardware metrics if available
     if 'cpu_cycles_per_op' in summary.columns:
+        table_columns.append(format_column(summary['cpu_cycles_per_op'], '%.1f'))
         headers.append('CPU Cycles/Op')
     
+    table_data = np.column_stack(table_columns).tolist()
+    
     table = ax.table(cellText=table_data, colLabels=headers, cellLoc='center', loc='center')
     table.auto_set_font_size(False)
     table.set_fontsize(10)
@@ -297,17 +537,18 @@ def create_summary_table(df, output_dir):
     plt.close()
     print(f"Created summary_table.png")
 
+def available_hardware_cols(frame):
+    """Return the hardware metric columns present in frame that hold at least one finite value"""
+    present_cols = [col for col in HARDWARE_COLS if col in frame.columns]
+    return [col for col in present_cols if np.isfinite(frame[col].to_numpy(dtype=np.float64)).any()]
+
 def create_hardware_metrics_charts(df, output_dir):
     """Create visualization charts for hardware performance metrics separated by test type"""
     if df.empty:
         return
     
     # Check if hardware metrics are available
-    hw_cols = ['cpu_cycles_per_op', 'instructions_per_cycle', 'l1_cache_miss_rate', 
-               'l2_cache_miss_rate', 'l3_cache_miss_rate', 'memory_bandwidth_gb_per_sec', 
-               'branch_misprediction_rate']
-    
-    available_cols = [col for col in hw_cols if col in df.columns and not df[col].isna().all()]
+    available_cols = available_hardware_cols(df)
     
     if not available_cols:
         print("No hardware metrics available for visualization")
@@ -317,78 +558,70 @@ def create_hardware_metrics_charts(df, output_dir):
     latency_data = df[df['test_type'] == 'latency'].copy()
     throughput_data = df[df['test_type'] == 'throughput'].copy()
     
+    # Both test types share one 2x2 figure, cleared between charts
+    fig, axes = plt.subplots(2, 2, figsize=(16, 12))
+    
     # Hardware metrics from latency test
     if not latency_data.empty:
-        create_hardware_metrics_for_test_type(latency_data, "Latency Test", "latency_test_hardware_metrics", available_cols, output_dir)
+        create_hardware_metrics_for_test_type(latency_data, "Latency Test", "latency_test_hardware_metrics", available_cols, axes, output_dir)
     
     # Hardware metrics from throughput test  
     if not throughput_data.empty:
-        create_hardware_metrics_for_test_type(throughput_data, "Throughput Test", "throughput_test_hardware_metrics", available_cols, output_dir)
+        create_hardware_metrics_for_test_type(throughput_data, "Throughput Test", "throughput_test_hardware_metrics", available_cols, axes, output_dir)
+    
+    plt.close(fig)
 
-def create_hardware_metrics_for_test_type(data, test_name, filename, available_cols, output_dir):
+def create_hardware_metrics_for_test_type(data, test_name, filename, available_cols, axes, output_dir):
     """Create hardware metrics chart for a specific test type"""
-    fig, axes = plt.subplots(2, 2, figsize=(16, 12))
+    fig = axes[0, 0].figure
+    for ax in axes.flat:
+        reset_axes(ax)
     fig.suptitle(f'Hardware Performance Metrics - {test_name}', fontsize=16)
     
-    if 'cpu_cycles_per_op' in available_cols:
-        ax = axes[0, 0]
-        cpu_data = data.dropna(subset=['cpu_cycles_per_op'])
-        if not cpu_data.empty:
-            sns.barplot(data=cpu_data, x='config', y='cpu_cycles_per_op', ax=ax)
-            ax.set_title('CPU Cycles per Operation')
-            ax.set_ylabel('Cycles/Operation')
-            ax.tick_params(axis='x', rotation=45)
-    
-    if 'instructions_per_cycle' in available_cols:
-        ax = axes[0, 1]
-        ipc_data = data.dropna(subset=['instructions_per_cycle'])
-        if not ipc_data.empty:
-            sns.barplot(data=ipc_data, x='config', y='instructions_per_cycle', ax=ax)
-            ax.set_title('Instructions per Cycle (IPC)')
-            ax.set_ylabel('Instructions/Cycle')
-            ax.tick_params(axis='x', rotation=45)
-    
-    if 'memory_bandwidth_gb_per_sec' in available_cols:
-        ax = axes[1, 0]
-        mem_data = data.dropna(subset=['memory_bandwidth_gb_per_sec'])
-        if not mem_data.empty:
-            sns.barplot(data=mem_data, x='config', y='memory_bandwidth_gb_per_sec', ax=ax)
-            ax.set_title('Memory Bandwidth Utilization')
-            ax.set_ylabel('Bandwidth (GB/s)')
-            ax.tick_params(axis='x', rotation=45)
-    
-    if 'branch_misprediction_rate' in available_cols:
-        ax = axes[1, 1]
-        branch_data = data.dropna(subset=['branch_misprediction_rate'])
-        if not branch_data.empty:
-            sns.barplot(data=branch_data, x='config', y='branch_misprediction_rate', ax=ax)
-            ax.set_title('Branch Misprediction Rate')
-            ax.set_ylabel('Misprediction Rate (%)')
-            ax.tick_params(axis='x', rotation=45)
+    # (axes, column, title, y label) for each panel
+    panels = [
+        (axes[0, 0], 'cpu_cycles_per_op', 'CPU Cycles per Operation', 'Cycles/Operation'),
+        (axes[0, 1], 'instructions_per_cycle', 'Instructions per Cycle (IPC)', 'Instructions/Cycle'),
+        (axes[1, 0], 'memory_bandwidth_gb_per_sec', 'Memory Bandwidth Utilization', 'Bandwidth (GB/s)'),
+        (axes[1, 1], 'branch_misprediction_rate', 'Branch Misprediction Rate', 'Misprediction Rate (%)')
+    ]
+    
+    drawn_panels = 0
+    for ax, col, title, ylabel in panels:
+        if col not in available_cols:
+            continue
+        metric_data = with_observed_configs(data.dropna(subset=[col]))
+        # Bars show per-config means, so judge variation on those rather than on individual runs
+        if not has_variation(metric_data.groupby('config', observed=True)[col].mean()):
+            print(f"Skipping {title} panel of {filename}.png: insufficient variation")
+            continue
+        sns.barplot(data=metric_data, x='config', y=col, ax=ax)
+        ax.set_title(title)
+        ax.set_ylabel(ylabel)
+        ax.tick_params(axis='x', rotation=45)
+        drawn_panels += 1
+    
+    if drawn_panels == 0:
+        skip_plot(output_dir, f"{filename}.png")
+        return
     
-    plt.tight_layout()
-    plt.savefig(f"{output_dir}/{filename}.png", dpi=300, bbox_inches='tight')
-    plt.close()
+    fig.tight_layout()
+    fig.savefig(f"{output_dir}/{filename}.png", dpi=150)
     print(f"Created {filename}.png")
 
-def create_hardware_summary_table(df, output_dir):
+def create_hardware_summary_table(summary, output_dir):
     """Create a comprehensive hardware metrics summary table"""
-    if df.empty:
+    if summary.empty:
         return
     
-    hw_cols = ['cpu_cycles_per_op', 'instructions_per_cycle', 'l1_cache_miss_rate', 
-               'l2_cache_miss_rate', 'l3_cache_miss_rate', 'memory_bandwidth_gb_per_sec', 
-               'branch_misprediction_rate']
-    
-    available_cols = [col for col in hw_cols if col in df.columns and not df[col].isna().all()]
+    # A group mean is NaN only if every value in the group is, so the summary tells us availability
+    available_cols = available_hardware_cols(summary)
     
     if not available_cols:
         print("No hardware metrics available for hardware summary table")
         return
     
-    agg_dict = {col: 'mean' for col in available_cols}
-    
-    hardware_summary = df.groupby(['config', 'test_type']).agg(agg_dict).round(3)
+    hardware_summary = summary[available_cols].round(3)
     
     hardware_summary.to_csv(f"{output_dir}/hardware_summary.csv")
     print(f"Created hardware_summary.csv")
@@ -397,42 +630,28 @@ def create_hardware_summary_table(df, output_dir):
     ax.axis('tight')
     ax.axis('off')
     
-    table_data = []
-    for (config, test_type), row in hardware_summary.iterrows():
-        table_row = [config, test_type]
-        
-        if 'cpu_cycles_per_op' in row:
-            table_row.append(f"{row['cpu_cycles_per_op']:.1f}")
-        if 'instructions_per_cycle' in row:
-            table_row.append(f"{row['instructions_per_cycle']:.3f}")
-        if 'l1_cache_miss_rate' in row:
-            table_row.append(f"{row['l1_cache_miss_rate']:.2f}%")
-        if 'l2_cache_miss_rate' in row:
-            table_row.append(f"{row['l2_cache_miss_rate']:.2f}%")
-        if 'l3_cache_miss_rate' in row:
-            table_row.append(f"{row['l3_cache_miss_rate']:.2f}%")
-        if 'memory_bandwidth_gb_per_sec' in row:
-            table_row.append(f"{row['memory_bandwidth_gb_per_sec']:.1f} GB/s")
-        if 'branch_misprediction_rate' in row:
-            table_row.append(f"{row['branch_misprediction_rate']:.3f}%")
-        
-        table_data.append(table_row)
-    
+    # (column, header, format) for each hardware metric, in table order
+    column_formats = [
+        ('cpu_cycles_per_op', 'CPU Cycles/Op', '%.1f'),
+        ('instructions_per_cycle', 'IPC', '%.3f'),
+        ('l1_cache_miss_rate', 'L1 Miss %', '%.2f%%'),
+        ('l2_cache_miss_rate', 'L2 Miss %', '%.2f%%'),
+        ('l3_cache_miss_rate', 'L3 Miss %', '%.2f%%'),
+        ('memory_bandwidth_gb_per_sec', 'Memory BW', '%.1f GB/s'),
+        ('branch_misprediction_rate', 'Branch Miss %', '%.3f%%')
+    ]
+    
+    table_columns = [
+        hardware_summary.index.get_level_values('config').to_numpy(),
+        hardware_summary.index.get_level_values('test_type').to_numpy()
+    ]
     headers = ['Configuration', 'Test Type']
-    if 'cpu_cycles_per_op' in hardware_summary.columns:
-        headers.append('CPU Cycles/Op')
-    if 'instructions_per_cycle' in hardware_summary.columns:
-        headers.append('IPC')
-    if 'l1_cache_miss_rate' in hardware_summary.columns:
-        headers.append('L1 Miss %')
-    if 'l2_cache_miss_rate' in hardware_summary.columns:
-        headers.append('L2 Miss %')
-    if 'l3_cache_miss_rate' in hardware_summary.columns:
-        headers.append('L3 Miss %')
-    if 'memory_bandwidth_gb_per_sec' in hardware_summary.columns:
-        headers.append('Memory BW')
-    if 'branch_misprediction_rate' in hardware_summary.columns:
-        headers.append('Branch Miss %')
+    for col, header, fmt in column_formats:
+        if col in hardware_summary.columns:
+            table_columns.append(format_column(hardware_summary[col], fmt))
+            headers.append(header)
+    
+    table_data = np.column_stack(table_columns).tolist()
     
     table = ax.table(cellText=table_data, colLabels=headers, cellLoc='center', loc='center')
     table.auto_set_font_size(False)